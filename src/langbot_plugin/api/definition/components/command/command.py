@@ -1,16 +1,15 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Callable, Coroutine, AsyncGenerator
 
-import pydantic
-from pydantic import BaseModel
-
 from langbot_plugin.api.definition.components.base import BaseComponent
 from langbot_plugin.api.entities.builtin.command import context
 from langbot_plugin.api.entities.builtin.command.errors import CommandNotFoundError
 
 
-class Subcommand(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Subcommand:
     """The subcommand model."""
 
     subcommand: Callable[
@@ -18,11 +17,11 @@ class Subcommand(BaseModel):
         Coroutine[Any, Any, AsyncGenerator[context.CommandReturn, None]],
     ]
     """The subcommand function."""
-    help: str
+    help: str = ""
     """The help message."""
-    usage: str
+    usage: str = ""
     """The usage message."""
-    aliases: list[str]
+    aliases: tuple[str, ...] = ()
     """The aliases of the subcommand."""
 
 
@@ -31,7 +30,7 @@ class Command(BaseComponent):
 
     __kind__ = "Command"
 
-    registered_subcommands: dict[str, Subcommand] = pydantic.Field(default_factory=dict)
+    registered_subcommands: dict[str, Subcommand]
 
     def __init__(self):
         self.registered_subcommands = {}
@@ -41,7 +40,7 @@ class Command(BaseComponent):
         name: str,
         help: str = "",
         usage: str = "",
-        aliases: list[str] = [],
+        aliases: list[str] | tuple[str, ...] = (),
     ) -> Callable[
         [
             Callable[
@@ -69,7 +68,7 @@ class Command(BaseComponent):
                 subcommand=subcommand,
                 help=help,
                 usage=usage,
-                aliases=aliases,
+                aliases=tuple(aliases),
             )
             return subcommand
 
@@ -1,5 +1,6 @@
 """Knowledge Engine components."""
 
+from .cache import EmbeddingCache
 from .engine import KnowledgeEngine, KnowledgeEngineCapability
 
-__all__ = ["KnowledgeEngine", "KnowledgeEngineCapability"]
+__all__ = ["EmbeddingCache", "KnowledgeEngine", "KnowledgeEngineCapability"]
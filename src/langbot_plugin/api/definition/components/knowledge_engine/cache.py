@@ -0,0 +1,153 @@
+"""Embedding cache for Knowledge Engines."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import operator
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from langbot_plugin.api.entities.builtin.rag.context import RetrievalResponse
+
+
+try:
+    from math import sumprod as _dot  # Python 3.12+
+except ImportError:
+
+    def _dot(a: list[float], b: list[float]) -> float:
+        return sum(map(operator.mul, a, b))
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(_dot(vector, vector))
+    if norm == 0.0:
+        return list(vector)
+    return [value / norm for value in vector]
+
+
+@dataclass(slots=True)
+class EmbeddingCacheEntry:
+    """A cached query embedding and, optionally, the response it produced."""
+
+    scope: str
+    """Scope the entry belongs to (knowledge base, filters and settings)."""
+
+    vector: list[float]
+    """Query embedding as returned by the embedding model."""
+
+    unit_vector: list[float]
+    """L2-normalized copy of `vector` used for similarity lookups."""
+
+    response: RetrievalResponse | None
+    """Retrieval response for the query, if one was stored."""
+
+    expires_at: float
+    """Monotonic deadline after which the entry is discarded (inf if never)."""
+
+
+class EmbeddingCache:
+    """LRU cache with an optional TTL for embeddings and retrieval responses.
+
+    Exact lookups use a SHA-256 key of the scope, model and query text.
+    Near lookups compare normalized embeddings by cosine similarity inside
+    one scope, so a rephrased query can reuse a previous response. They
+    run on the event loop, so each one compares against at most
+    `max_near_candidates` of the most recently used responses.
+
+    A Knowledge Engine opts in by keeping one instance, e.g. created in
+    `initialize()`, and passing it to `KnowledgeEngine.retrieve_cached`.
+    Chunk embeddings for `KnowledgeEngine.embed_in_batches` are deterministic
+    and far more numerous, so they belong in a separate, larger instance
+    with `ttl=None`, which keeps entries until they are evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float | None = 300.0,
+        max_near_candidates: int = 64,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_near_candidates = max_near_candidates
+        self._entries: OrderedDict[str, EmbeddingCacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(scope: str, model: str, query: str) -> str:
+        """Build the exact-lookup key for a query."""
+        payload = json.dumps([scope, model, query], ensure_ascii=False)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> EmbeddingCacheEntry | None:
+        """Return the live entry stored under `key`, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get_near(
+        self, scope: str, vector: list[float], tau: float
+    ) -> EmbeddingCacheEntry | None:
+        """Return the most similar entry with a response in `scope`.
+
+        Only entries whose cosine similarity to `vector` is at least `tau`
+        are considered, among the `max_near_candidates` most recently used
+        entries with a response in `scope`.
+        """
+        query = _normalize(vector)
+        now = time.monotonic()
+        best_key: str | None = None
+        best_similarity = tau
+        candidates = 0
+        # Most recently used first, so the cap keeps the hottest responses
+        for key in reversed(list(self._entries)):
+            entry = self._entries[key]
+            if entry.expires_at <= now:
+                del self._entries[key]
+                continue
+            if entry.scope != scope or entry.response is None:
+                continue
+            similarity = _dot(query, entry.unit_vector)
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+            candidates += 1
+            if candidates >= self.max_near_candidates:
+                break
+
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key]
+
+    def put(
+        self,
+        key: str,
+        scope: str,
+        vector: list[float],
+        response: RetrievalResponse | None = None,
+    ) -> None:
+        """Store an embedding, and optionally its response, under `key`."""
+        self._entries[key] = EmbeddingCacheEntry(
+            scope=scope,
+            vector=vector,
+            unit_vector=_normalize(vector),
+            response=response,
+            expires_at=(math.inf if self.ttl is None else time.monotonic() + self.ttl),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
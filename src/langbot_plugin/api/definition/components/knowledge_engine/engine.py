@@ -1,17 +1,28 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import json
+from typing import Awaitable, Callable, ClassVar
 
 from langbot_plugin.api.definition.components.base import BaseComponent
+from langbot_plugin.api.definition.components.knowledge_engine.cache import (
+    EmbeddingCache,
+)
 from langbot_plugin.api.entities.builtin.rag.context import (
     RetrievalContext,
     RetrievalResponse,
+    RetrievalResultEntry,
 )
+from langbot_plugin.api.entities.builtin.rag.errors import EmbeddingError
 from langbot_plugin.api.entities.builtin.rag.models import (
     IngestionContext,
     IngestionResult,
 )
 
+# Query scopes are JSON arrays, so chunk embeddings can never collide with them.
+_CHUNK_CACHE_SCOPE = "__chunks__"
+
 
 class KnowledgeEngineCapability:
     """Standard Knowledge Engine capabilities.
@@ -51,20 +62,31 @@ class KnowledgeEngine(BaseComponent):
 
     # ========== Capabilities ==========
 
+    CAPABILITIES: ClassVar[frozenset[str]] = frozenset(
+        {KnowledgeEngineCapability.DOC_INGESTION}
+    )
+    """Capabilities this Knowledge Engine supports.
+
+    Override this attribute to declare what capabilities your Knowledge Engine supports,
+    and test membership with `KnowledgeEngineCapability.DOC_PARSING in self.CAPABILITIES`.
+    The frontend will use these to determine which UI elements to show.
+
+    Available capabilities (see KnowledgeEngineCapability):
+    - 'doc_ingestion': Supports document upload and processing
+    - 'doc_parsing': Supports native document parsing
+    """
+
     @classmethod
     def get_capabilities(cls) -> list[str]:
-        """Declare Knowledge Engine capabilities.
+        """Report Knowledge Engine capabilities to the host.
 
-        Override this method to declare what capabilities your Knowledge Engine supports.
-        The frontend will use these to determine which UI elements to show.
-
-        Available capabilities (see KnowledgeEngineCapability):
-        - 'doc_ingestion': Supports document upload and processing
+        Returns `CAPABILITIES` as a sorted list. Engines written against older SDK
+        versions may still override this method instead of `CAPABILITIES`.
 
         Returns:
             List of capability strings.
         """
-        return [KnowledgeEngineCapability.DOC_INGESTION]
+        return sorted(cls.CAPABILITIES)
 
     # ========== Lifecycle Hooks ==========
 
@@ -85,6 +107,218 @@ class KnowledgeEngine(BaseComponent):
         """
         pass
 
+    # ========== Helpers ==========
+
+    async def embed_in_batches(
+        self,
+        embedding_model_uuid: str,
+        texts: list[str],
+        batch_size: int = 16,
+        max_concurrency: int = 8,
+        cache: EmbeddingCache | None = None,
+    ) -> list[list[float]]:
+        """Embed texts with batched `self.plugin.invoke_embedding` calls.
+
+        Texts are sorted by length before being split into batches so that each
+        batch holds texts of similar size, and at most `max_concurrency` batches
+        are in flight at once. Identical texts are embedded once. The returned
+        vectors follow the order of `texts`.
+
+        When `cache` is given, texts already embedded with the same model are
+        served from it and only the misses are sent to the embedding model, so
+        re-ingesting a document does not pay for unchanged chunks again. Use a
+        cache dedicated to chunks, e.g. `EmbeddingCache(max_entries=100_000,
+        ttl=None)`, not the one given to `retrieve_cached`: chunk embeddings
+        would otherwise evict cached query responses and expire with them.
+
+        Args:
+            embedding_model_uuid: The UUID of the embedding model to use.
+            texts: Texts to embed.
+            batch_size: Maximum number of texts sent per embedding call.
+            max_concurrency: Maximum number of concurrent embedding calls.
+            cache: Optional chunk embedding cache owned by this engine.
+
+        Returns:
+            List of embedding vectors, one per input text.
+
+        Raises:
+            EmbeddingError: If a batch returns a different number of vectors
+                than texts sent.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        vectors: list[list[float]] = [[] for _ in texts]
+        pending: dict[str, list[int]] = {}
+        for index, text in enumerate(texts):
+            if cache is not None:
+                entry = cache.get(
+                    cache.make_key(_CHUNK_CACHE_SCOPE, embedding_model_uuid, text)
+                )
+                if entry is not None:
+                    vectors[index] = entry.vector
+                    continue
+            pending.setdefault(text, []).append(index)
+
+        unique = sorted(pending, key=len, reverse=True)
+        batches = [
+            unique[i : i + batch_size] for i in range(0, len(unique), batch_size)
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                vectors = await self.plugin.invoke_embedding(
+                    embedding_model_uuid, batch
+                )
+            if len(vectors) != len(batch):
+                raise EmbeddingError(
+                    f"Embedding model {embedding_model_uuid} returned "
+                    f"{len(vectors)} vectors for {len(batch)} texts"
+                )
+            return vectors
+
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+
+        for batch, batch_vectors in zip(batches, results):
+            for text, vector in zip(batch, batch_vectors):
+                for index in pending[text]:
+                    vectors[index] = vector
+                if cache is not None:
+                    cache.put(
+                        cache.make_key(_CHUNK_CACHE_SCOPE, embedding_model_uuid, text),
+                        _CHUNK_CACHE_SCOPE,
+                        vector,
+                    )
+        return vectors
+
+    async def retrieve_hybrid(
+        self,
+        context: RetrievalContext,
+        vector_fn: Callable[[RetrievalContext], Awaitable[list[RetrievalResultEntry]]],
+        keyword_fn: Callable[[RetrievalContext], Awaitable[list[RetrievalResultEntry]]],
+        rrf_k: int = 60,
+    ) -> RetrievalResponse:
+        """Run vector and keyword retrieval concurrently and fuse the rankings.
+
+        Both arms are awaited together, so the latency is that of the slower
+        arm rather than their sum. Results are merged with reciprocal rank
+        fusion: an entry scores `1 / (rrf_k + rank)` for each list it appears
+        in, and entries sharing an `id` are merged. The fused value is stored
+        in `score` and results are ordered by it, highest first.
+
+        Args:
+            context: Retrieval context passed to both arms.
+            vector_fn: Coroutine function returning vector search results, best first.
+            keyword_fn: Coroutine function returning keyword search results, best first.
+            rrf_k: Rank offset of the fusion formula.
+
+        Returns:
+            Structured retrieval response with the fused results.
+        """
+        vector_results, keyword_results = await asyncio.gather(
+            vector_fn(context), keyword_fn(context)
+        )
+
+        entries: dict[str, RetrievalResultEntry] = {}
+        scores: dict[str, float] = {}
+        for results in (vector_results, keyword_results):
+            for rank, entry in enumerate(results, start=1):
+                entries.setdefault(entry.id, entry)
+                scores[entry.id] = scores.get(entry.id, 0.0) + 1.0 / (rrf_k + rank)
+
+        fused = [
+            entries[entry_id].model_copy(update={"score": score})
+            for entry_id, score in sorted(
+                scores.items(), key=lambda item: item[1], reverse=True
+            )
+        ]
+        return RetrievalResponse(results=fused, total_found=len(fused))
+
+    @staticmethod
+    def _query_cache_scope(context: RetrievalContext) -> str:
+        """Identify the result space a query is answered from."""
+        return json.dumps(
+            [
+                context.get_collection_id(),
+                context.filters,
+                context.retrieval_settings,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+    async def embed_query_cached(
+        self,
+        context: RetrievalContext,
+        embedding_model_uuid: str,
+        cache: EmbeddingCache,
+    ) -> list[float]:
+        """Embed `context.query`, reusing a cached embedding when available.
+
+        Args:
+            context: Retrieval context holding the query.
+            embedding_model_uuid: The UUID of the embedding model to use.
+            cache: Cache owned by this engine.
+
+        Returns:
+            The query embedding.
+        """
+        scope = self._query_cache_scope(context)
+        key = cache.make_key(scope, embedding_model_uuid, context.query)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry.vector
+
+        vector = (
+            await self.plugin.invoke_embedding(embedding_model_uuid, [context.query])
+        )[0]
+        cache.put(key, scope, vector)
+        return vector
+
+    async def retrieve_cached(
+        self,
+        context: RetrievalContext,
+        embedding_model_uuid: str,
+        cache: EmbeddingCache,
+        tau: float = 0.95,
+    ) -> RetrievalResponse:
+        """Serve `retrieve` from a semantic cache when possible.
+
+        The query embedding is looked up (or computed) through
+        `embed_query_cached`. If a cached response exists for a query in the
+        same scope whose embedding has cosine similarity of at least `tau`,
+        it is returned without calling `retrieve`. Otherwise `retrieve` runs
+        and its response is cached. Engines using this should embed inside
+        `retrieve` via `embed_query_cached` so the query is embedded once.
+
+        Args:
+            context: Retrieval context with query and settings.
+            embedding_model_uuid: The UUID of the embedding model to use.
+            cache: Cache owned by this engine.
+            tau: Minimum cosine similarity for a cached response to be reused.
+
+        Returns:
+            Structured retrieval response.
+        """
+        scope = self._query_cache_scope(context)
+        vector = await self.embed_query_cached(context, embedding_model_uuid, cache)
+
+        entry = cache.get_near(scope, vector, tau)
+        if entry is not None and entry.response is not None:
+            return entry.response
+
+        response = await self.retrieve(context)
+        cache.put(
+            cache.make_key(scope, embedding_model_uuid, context.query),
+            scope,
+            vector,
+            response,
+        )
+        return response
+
     # ========== Core Methods ==========
 
     @abc.abstractmethod
@@ -94,7 +328,7 @@ class KnowledgeEngine(BaseComponent):
         This method should:
         1. Read the file using `await self.plugin.get_knowledge_file_stream(context.file_object.storage_path)`
         2. Parse and chunk the content
-        3. Embed using `await self.plugin.invoke_embedding(embedding_model_uuid, [chunk.text for chunk in chunks])`
+        3. Embed using `await self.embed_in_batches(embedding_model_uuid, [chunk.text for chunk in chunks])`
         4. Store using `await self.plugin.vector_upsert(collection_id=context.get_collection_id(), ...)`
 
         Args:
@@ -129,6 +363,10 @@ class KnowledgeEngine(BaseComponent):
         2. Search using `await self.plugin.vector_search(kb_id, ...)`
         3. Return structured response
 
+        Engines that combine vector and keyword search should run both through
+        `await self.retrieve_hybrid(context, vector_fn, keyword_fn)` so the two
+        searches run concurrently.
+
         Args:
             context: Retrieval context with query and settings.
 
@@ -21,9 +21,6 @@ class BasePlugin(abc.ABC, langbot_api.LangBotAPIProxy):
     async def initialize(self) -> None:
         pass
 
-    def __del__(self) -> None:
-        pass
-
 
 class NonePlugin(BasePlugin):
     """The plugin that does nothing, just acts as a placeholder."""
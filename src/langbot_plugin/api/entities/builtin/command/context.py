@@ -53,9 +53,6 @@ class CommandReturn(pydantic.BaseModel):
             return v.message
         return v
 
-    class Config:
-        arbitrary_types_allowed = True
-
 
 class ExecuteContext(WorkspaceExecutionScope):
     """单次命令执行上下文"""
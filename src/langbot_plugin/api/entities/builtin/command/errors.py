@@ -1,31 +1,32 @@
+from typing import ClassVar
+
 import pydantic
 
 
 class CommandError(pydantic.BaseModel):
     message: str
 
-    def __init__(self, message: str):
-        super().__init__(message=message)
+    prefix: ClassVar[str] = ""
+    """User-visible prefix prepended to the message on construction."""
+
+    def __init__(self, message: str = ""):
+        super().__init__(message=self.prefix + message)
 
     def __str__(self):
         return self.message
 
 
 class CommandNotFoundError(CommandError):
-    def __init__(self, message: str = ""):
-        super().__init__("未知命令: " + message)
+    prefix = "未知命令: "
 
 
 class CommandPrivilegeError(CommandError):
-    def __init__(self, message: str = ""):
-        super().__init__("权限不足: " + message)
+    prefix = "权限不足: "
 
 
 class ParamNotEnoughError(CommandError):
-    def __init__(self, message: str = ""):
-        super().__init__("参数不足: " + message)
+    prefix = "参数不足: "
 
 
 class CommandOperationError(CommandError):
-    def __init__(self, message: str = ""):
-        super().__init__("操作失败: " + message)
+    prefix = "操作失败: "
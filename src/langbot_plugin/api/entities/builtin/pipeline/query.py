@@ -90,9 +90,6 @@ class Query(WorkspaceExecutionScope):
     current_stage_name: typing.Optional[str] = None
     """当前所处阶段"""
 
-    class Config:
-        arbitrary_types_allowed = True
-
     @pydantic.model_validator(mode="after")
     def propagate_execution_scope(self) -> Query:
         """Keep nested Event and Session scope aligned with this Query."""
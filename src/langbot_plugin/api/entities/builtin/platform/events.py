@@ -5,6 +5,8 @@
 
 import typing
 
+import pydantic
+
 from langbot_plugin.api.entities.builtin.platform import entities as platform_entities
 from langbot_plugin.api.entities.builtin.platform import message as platform_message
 from langbot_plugin.api.entities.execution import WorkspaceExecutionScope
@@ -20,33 +22,46 @@ class Event(WorkspaceExecutionScope):
     type: str
     """事件名。"""
 
+    _repr_fields: typing.ClassVar[tuple[str, ...]] = ()
+    """Field names shown by `__repr__`, computed once per class."""
+
+    _subtypes: typing.ClassVar[dict[str, typing.Type["Event"]]] = {}
+    """Concrete event classes keyed by their `type` tag."""
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._repr_fields = tuple(name for name in cls.model_fields if name != "type")
+        # Only classes declaring their own tag register, so subclassing e.g.
+        # FriendMessage does not take over its tag
+        event_type = cls.model_fields["type"].default
+        if "type" in cls.__annotations__ and isinstance(event_type, str):
+            Event._subtypes[event_type] = cls
+
     def __repr__(self):
-        return (
-            self.__class__.__name__
-            + "("
-            + ", ".join(
-                (
-                    f"{k}={repr(v)}"
-                    for k, v in self.__dict__.items()
-                    if k != "type" and v
-                )
-            )
-            + ")"
-        )
+        values = self.__dict__
+        args = []
+        for name in self._repr_fields:
+            value = values.get(name)
+            if value:
+                args.append(f"{name}={value!r}")
+        return f"{self.__class__.__name__}({', '.join(args)})"
 
     @classmethod
     def parse_subtype(cls, obj: dict) -> "Event":
-        try:
-            return typing.cast(Event, super().parse_obj(obj))
-        except ValueError:
+        subtype = cls.get_subtype(obj["type"])
+        if subtype is Event:
+            # Unknown event type, keep only its tag
             return Event(type=obj["type"])
+        # Invalid data for a known type raises instead of being dropped
+        return subtype.model_validate(obj)
 
     @classmethod
     def get_subtype(cls, name: str) -> typing.Type["Event"]:
-        try:
-            return typing.cast(typing.Type[Event], super().get_subtype(name))  # type: ignore
-        except ValueError:
-            return Event
+        return Event._subtypes.get(name, Event)
+
+
+Event._repr_fields = tuple(name for name in Event.model_fields if name != "type")
 
 
 ###############################
@@ -67,10 +82,21 @@ class MessageEvent(Event):
     time: float | None = None
     """消息发送时间戳。"""
 
-    source_platform_object: typing.Optional[typing.Any] = None
+    source_platform_object: typing.Optional[typing.Any] = pydantic.Field(
+        default=None, exclude=True
+    )
     """原消息平台对象。
     供消息平台适配器开发者使用，如果回复用户时需要使用原消息事件对象的信息，
-    那么可以将其存到这个字段以供之后取出使用。"""
+    那么可以将其存到这个字段以供之后取出使用。不参与序列化。"""
+
+    @pydantic.model_serializer(mode="wrap")
+    def serialize_without_empty_scope(self, handler):
+        """Omit unset execution scope fields, matching `execution_scope_dump`."""
+        data = handler(self)
+        for field_name in ("instance_uuid", "workspace_uuid", "placement_generation"):
+            if field_name in data and data[field_name] is None:
+                del data[field_name]
+        return data
 
 
 class FriendMessage(MessageEvent):
@@ -82,22 +108,13 @@ class FriendMessage(MessageEvent):
         message_chain: 消息内容。
     """
 
-    type: str = "FriendMessage"
+    type: typing.Literal["FriendMessage"] = "FriendMessage"
     """事件名。"""
     sender: platform_entities.Friend
     """发送消息的好友。"""
     message_chain: platform_message.MessageChain
     """消息内容。"""
 
-    def model_dump(self, **kwargs):
-        return {
-            **self.execution_scope_dump(),
-            "type": self.type,
-            "sender": self.sender.model_dump(),
-            "message_chain": self.message_chain.model_dump(),
-            "time": self.time,
-        }
-
 
 class GroupMessage(MessageEvent):
     """群消息。
@@ -108,7 +125,7 @@ class GroupMessage(MessageEvent):
         message_chain: 消息内容。
     """
 
-    type: str = "GroupMessage"
+    type: typing.Literal["GroupMessage"] = "GroupMessage"
     """事件名。"""
     sender: platform_entities.GroupMember
     """发送消息的群成员。"""
@@ -119,15 +136,6 @@ class GroupMessage(MessageEvent):
     def group(self) -> platform_entities.Group:
         return self.sender.group
 
-    def model_dump(self, **kwargs):
-        return {
-            **self.execution_scope_dump(),
-            "type": self.type,
-            "sender": self.sender.model_dump(),
-            "message_chain": self.message_chain.model_dump(),
-            "time": self.time,
-        }
-
 
 ###############################
 # Feedback Event
@@ -154,7 +162,7 @@ class FeedbackEvent(Event):
             adapter-level introspection.
     """
 
-    type: str = "FeedbackEvent"
+    type: typing.Literal["FeedbackEvent"] = "FeedbackEvent"
 
     feedback_id: str
     """Unique feedback identifier from the platform."""
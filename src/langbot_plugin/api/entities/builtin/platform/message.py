@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-import base64
+import binascii
 import httpx
 import typing
+import weakref
 import aiofiles
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +14,40 @@ import pydantic
 
 MAX_IMAGE_BYTES = 10 * 1024 * 1024
 
+_DATA_URL_HEADER_MAX = 256
+
+_HTTP_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by image downloads on the running event loop.
+
+    Reusing the client keeps connections alive across downloads, so repeated
+    fetches from the same host skip the TCP and TLS handshakes.
+    """
+    loop = asyncio.get_running_loop()
+    client = _HTTP_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        _HTTP_CLIENTS[loop] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close the image download client of the running event loop, if any.
+
+    Call this before the loop ends, e.g. on plugin process shutdown, so its
+    pooled connections are released instead of leaking.
+    """
+    client = _HTTP_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 async def _read_httpx_body_limited(
     response: httpx.Response,
@@ -42,45 +77,42 @@ class MessageComponent(pydantic.BaseModel):
     """Type of the message component."""
 
 
-class MessageChain(pydantic.RootModel[list[pydantic.SerializeAsAny[MessageComponent]]]):
+class MessageChain(pydantic.RootModel):
     """Message chain, a list of message components."""
 
-    def __init__(self, root: list[MessageComponent] = []):
+    root: list[_ChainComponent]
+
+    def __init__(self, root: list[MessageComponent] | None = None):
         """Initialize the message chain."""
-        if not isinstance(root, list):
+        if root is None:
+            root = []
+        elif not isinstance(root, list):
             raise ValueError("root must be a list")
         for item in root:
             if not isinstance(item, MessageComponent):
                 raise ValueError(
                     f"root must be a list of MessageComponent, but got {type(item)}"
                 )
-        super().__init__(root=root)
+        # Every item is a component instance, which validation would keep
+        # as-is, so skip the discriminated union and set the state the way
+        # `model_construct` does (on a copy, as validation would make)
+        object.__setattr__(self, "__dict__", {"root": list(root)})
+        object.__setattr__(self, "__pydantic_fields_set__", {"root"})
+
+    @classmethod
+    def from_trusted(cls, root: list[MessageComponent]) -> MessageChain:
+        """Build a chain from a list known to hold only message components.
+
+        Skips the checks in `__init__` and pydantic validation; the list is
+        used as-is, not copied. Untrusted input should go through the
+        constructor or `model_validate`.
+        """
+        return cls.model_construct(root)
 
     @classmethod
     def _get_component_types(cls) -> dict[str, type[MessageComponent]]:
         """Get the component type mapping dictionary."""
-        return {
-            "Source": Source,
-            "Plain": Plain,
-            "Quote": Quote,
-            "At": At,
-            "AtAll": AtAll,
-            "Image": Image,
-            "Unknown": Unknown,
-            "Voice": Voice,
-            "Forward": Forward,
-            "File": File,
-            "WeChatMiniPrograms": WeChatMiniPrograms,
-            "WeChatForwardMiniPrograms": WeChatForwardMiniPrograms,
-            "WeChatEmoji": WeChatEmoji,
-            "WeChatLink": WeChatLink,
-            "WeChatForwardLink": WeChatForwardLink,
-            "WeChatForwardImage": WeChatForwardImage,
-            "WeChatForwardFile": WeChatForwardFile,
-            "WeChatAppMsg": WeChatAppMsg,
-            "WeChatForwardQuote": WeChatForwardQuote,
-            "WeChatFile": WeChatFile,
-        }
+        return _COMPONENT_TYPES
 
     def get_first(self, t: type[MessageComponent]) -> MessageComponent | None:
         """Get the first message component of the specified type."""
@@ -108,15 +140,19 @@ class MessageChain(pydantic.RootModel[list[pydantic.SerializeAsAny[MessageCompon
         self, item: typing.Union[MessageComponent, type[MessageComponent]]
     ):
         if isinstance(item, type):
-            return any(isinstance(component, item) for component in self.root)
+            return self.get_first(item) is not None
         else:
             return item in self.root
 
     def __str__(self):
+        # Read Plain.text directly, skipping a Python-level __str__ call for
+        # the most common component
         return "".join(
-            str(component)
-            for component in self.root
-            if not isinstance(component, Source)
+            [
+                component.text if type(component) is Plain else str(component)
+                for component in self.root
+                if not isinstance(component, Source)
+            ]
         )
 
     def __repr__(self):
@@ -131,11 +167,43 @@ class MessageChain(pydantic.RootModel[list[pydantic.SerializeAsAny[MessageCompon
     def __hash__(self):
         return hash(tuple(self.root))
 
+    @staticmethod
+    def _operand_components(other: typing.Any) -> list[MessageComponent] | None:
+        """Components added by `+` / `+=` for `other`, or None if unsupported."""
+        if isinstance(other, MessageChain):
+            return other.root
+        if isinstance(other, str):
+            return [Plain(text=other)]
+        if isinstance(other, MessageComponent):
+            return [other]
+        return None
+
     def __add__(self, other):
-        return MessageChain(self.root + other.root)
+        components = self._operand_components(other)
+        if components is None:
+            return NotImplemented
+        return MessageChain.from_trusted(self.root + components)
 
     def __radd__(self, other):
-        return MessageChain(other.root + self.root)
+        components = self._operand_components(other)
+        if components is None:
+            return NotImplemented
+        return MessageChain.from_trusted(components + self.root)
+
+    def __iadd__(self, other):
+        """Extend the chain in place, like `list`; `+` still returns a new chain.
+
+        Accepts the same operands as `+`: a chain, a component, or a `str`
+        (added as `Plain`). Since the chain itself is modified, every other
+        reference to it sees the change, e.g. after
+        `chain = event.message_chain; chain += extra` the event's chain is
+        extended too. Use `chain = chain + extra` to keep the original intact.
+        """
+        components = self._operand_components(other)
+        if components is None:
+            return NotImplemented
+        self.root.extend(components)
+        return self
 
     def append(self, item: MessageComponent):
         self.root.append(item)
@@ -158,6 +226,10 @@ class MessageChain(pydantic.RootModel[list[pydantic.SerializeAsAny[MessageCompon
     @property
     def source(self):
         """Get the Source component in the message chain."""
+        root = self.root
+        # Source is normally the first element, only scan when it is not
+        if root and isinstance(root[0], Source):
+            return root[0]
         return self.get_first(Source)
 
     @property
@@ -166,77 +238,29 @@ class MessageChain(pydantic.RootModel[list[pydantic.SerializeAsAny[MessageCompon
         src = self.source
         return src.id if src else -1
 
-    def model_dump(self, **kwargs):
-        result = []
-        for component in self.root:
-            data = component.model_dump()
-            # Recursively process the MessageChain type field
-            for field_name, field_info in component.__class__.model_fields.items():
-                if field_info.annotation is MessageChain and field_name in data:
-                    field_value = getattr(component, field_name)
-                    if isinstance(field_value, MessageChain):
-                        data[field_name] = field_value.model_dump()
-            result.append(data)
-        return result
-
-    @classmethod
-    def model_validate(cls, obj):
-        """Custom deserialization logic, create the correct MessageComponent subclass instance according to the type field, and recursively process the MessageChain field"""
-
-        if isinstance(obj, list):
-            components = []
-            component_types = cls._get_component_types()
-            for item in obj:
-                if isinstance(item, dict) and "type" in item:
-                    component_type = item["type"]
-                    if component_type in component_types:
-                        component_class = component_types[component_type]
-                        # Recursively process the MessageChain type field
-                        for (
-                            field_name,
-                            field_info,
-                        ) in component_class.model_fields.items():
-                            if (
-                                field_info.annotation is MessageChain
-                                and field_name in item
-                            ):
-                                field_value = item[field_name]
-                                if isinstance(field_value, MessageChain):
-                                    # It is already a MessageChain, no need to process
-                                    pass
-                                elif isinstance(field_value, list):
-                                    item[field_name] = MessageChain.model_validate(
-                                        field_value
-                                    )
-                        # Special handling for Forward: recursively deserialize
-                        # message_chain inside each ForwardMessageNode
-                        if component_type == "Forward" and "node_list" in item:
-                            for node_data in item["node_list"]:
-                                if (
-                                    isinstance(node_data, dict)
-                                    and "message_chain" in node_data
-                                ):
-                                    mc = node_data["message_chain"]
-                                    if isinstance(mc, list):
-                                        node_data["message_chain"] = (
-                                            MessageChain.model_validate(mc)
-                                        )
-
-                        # Special processing of the time field of the Source class
-                        if component_type == "Source" and "time" in item:
-                            item["time"] = datetime.fromtimestamp(item["time"])
-                        components.append(component_class.model_validate(item))
-                    else:
-                        # Unknown type, create Unknown component
-                        components.append(
-                            Unknown(text=f"Unknown component type: {component_type}")
-                        )
-                else:
-                    # Not a dictionary or no type field, create Unknown component
-                    components.append(Unknown(text=f"Invalid component data: {item}"))
-            return cls(root=components)
-        else:
-            return super().model_validate(obj)
+    async def fetch_images(self, concurrency: int = 8) -> list[tuple[bytes, str]]:
+        """Get the bytes and mimetype of every Image in the chain, concurrently.
+
+        Results are in chain order. At most `concurrency` images are fetched at
+        a time; remote images share one HTTP client.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(image: Image) -> tuple[bytes, str]:
+            async with semaphore:
+                return await image.get_bytes()
+
+        return list(
+            await asyncio.gather(
+                *(
+                    fetch(component)
+                    for component in self.root
+                    if isinstance(component, Image)
+                )
+            )
+        )
 
 
 class Source(MessageComponent):
@@ -249,22 +273,31 @@ class Source(MessageComponent):
     time: datetime = pydantic.Field(serialization_alias="timestamp")
     """Message time."""
 
-    def model_dump(self, **kwargs):
-        data = super().model_dump(**kwargs)
+    @pydantic.model_serializer(mode="wrap")
+    def _time_to_timestamp(
+        self, handler: pydantic.SerializerFunctionWrapHandler
+    ) -> typing.Any:
+        data = handler(self)
         # 将datetime转换为时间戳
-        if "time" in data:
-            data["timestamp"] = int(self.time.timestamp())
-            del data["time"]
+        for key in ("time", "timestamp"):
+            if key in data:
+                del data[key]
+                data["timestamp"] = int(self.time.timestamp())
         return data
 
+    @pydantic.model_validator(mode="wrap")
     @classmethod
-    def model_validate(cls, obj):
-        if isinstance(obj, dict) and "timestamp" in obj:
-            # 将时间戳转换为datetime
-            timestamp = obj["timestamp"]
-            obj["time"] = datetime.fromtimestamp(timestamp)
-            del obj["timestamp"]
-        return super().model_validate(obj)
+    def _timestamp_to_time(
+        cls, data: typing.Any, handler: pydantic.ValidatorFunctionWrapHandler
+    ) -> Source:
+        # 将时间戳转换为本地时间的 datetime
+        if isinstance(data, dict):
+            if "timestamp" in data:
+                data = dict(data)
+                data["time"] = datetime.fromtimestamp(data.pop("timestamp"))
+            elif isinstance(data.get("time"), (int, float)):
+                data = {**data, "time": datetime.fromtimestamp(data["time"])}
+        return handler(data)
 
 
 class Plain(MessageComponent):
@@ -347,35 +380,49 @@ class Image(MessageComponent):
             and self.uuid == other.uuid
         )
 
+    @property
+    def uuid(self) -> str:
+        """The UUID part of image_id, used to compare images."""
+        image_id = self.image_id or ""
+        # Group images look like "{UUID}.ext", friend images like "/UUID"
+        if image_id.startswith("{"):
+            return image_id[1:37]
+        if image_id.startswith("/"):
+            return image_id[1:]
+        return image_id
+
     def __str__(self):
         return "[Image]"
 
     async def get_bytes(self) -> typing.Tuple[bytes, str]:
         """Get image bytes and mimetype"""
         if self.url:
-            async with httpx.AsyncClient(timeout=30) as client:
-                async with client.stream("GET", self.url) as response:
-                    response.raise_for_status()
-                    return (
-                        await _read_httpx_body_limited(response),
-                        response.headers.get(
-                            "Content-Type", "application/octet-stream"
-                        ),
-                    )
+            client = _get_http_client()
+            async with client.stream("GET", self.url) as response:
+                response.raise_for_status()
+                return (
+                    await _read_httpx_body_limited(response),
+                    response.headers.get("Content-Type", "application/octet-stream"),
+                )
         elif self.base64:
-            mime_type = "image/jpeg"
-
-            split_index = self.base64.find(";base64,")
+            # The media type lives in a short "data:" header, so bound the search
+            # instead of scanning a multi-megabyte payload for the delimiter
+            split_index = -1
+            if self.base64.startswith("data:"):
+                split_index = self.base64.find(";base64,", 5, _DATA_URL_HEADER_MAX)
             if split_index == -1:
                 raise ValueError("Invalid base64 string")
 
             mime_type = self.base64[5:split_index]
-            base64_data = self.base64[split_index + 8 :]
+            # Encode once and slice a memoryview so the payload is not copied again
+            encoded = self.base64.encode("ascii")
+            base64_data = memoryview(encoded)[split_index + 8 :]
             max_encoded_bytes = 4 * ((MAX_IMAGE_BYTES + 2) // 3)
             if len(base64_data) > max_encoded_bytes:
                 raise ValueError(f"Image exceeds the {MAX_IMAGE_BYTES}-byte limit")
 
-            decoded = await asyncio.to_thread(base64.b64decode, base64_data)
+            # base64.b64decode would copy a memoryview into bytes first
+            decoded = await asyncio.to_thread(binascii.a2b_base64, base64_data)
             if len(decoded) > MAX_IMAGE_BYTES:
                 raise ValueError(f"Image exceeds the {MAX_IMAGE_BYTES}-byte limit")
             return decoded, mime_type
@@ -432,7 +479,7 @@ class ForwardMessageNode(pydantic.BaseModel):
     sender_name: typing.Optional[str] = pydantic.Field(default="")
     """Display name."""
     message_chain: typing.Optional[MessageChain] = pydantic.Field(
-        default=MessageChain([])
+        default_factory=MessageChain
     )
     """Message content."""
     message_id: typing.Optional[int] = pydantic.Field(default=0)
@@ -506,13 +553,17 @@ class Face(MessageComponent):
         elif self.face_type == "rps":
             return f"[表情]{self.face_name}({self.rps_data(self.face_id)})"
 
-    def rps_data(self, face_id):
-        rps_dict = {
-            1: "布",
-            2: "剪刀",
-            3: "石头",
-        }
-        return rps_dict[face_id]
+    @staticmethod
+    def rps_data(face_id):
+        return _RPS_NAMES[face_id]
+
+
+_RPS_NAMES: dict[int, str] = {
+    1: "布",
+    2: "剪刀",
+    3: "石头",
+}
+"""划拳表情 face_id 对应的手势"""
 
 
 # ================ 个人微信专用组件 ================
@@ -646,3 +697,92 @@ class WeChatFile(MessageComponent):
 
     def __str__(self):
         return f"[文件]{self.file_name}"
+
+
+_COMPONENT_TYPES: dict[str, type[MessageComponent]] = {
+    "Source": Source,
+    "Plain": Plain,
+    "Quote": Quote,
+    "At": At,
+    "AtAll": AtAll,
+    "Image": Image,
+    "Unknown": Unknown,
+    "Voice": Voice,
+    "Forward": Forward,
+    "File": File,
+    "WeChatMiniPrograms": WeChatMiniPrograms,
+    "WeChatForwardMiniPrograms": WeChatForwardMiniPrograms,
+    "WeChatEmoji": WeChatEmoji,
+    "WeChatLink": WeChatLink,
+    "WeChatForwardLink": WeChatForwardLink,
+    "WeChatForwardImage": WeChatForwardImage,
+    "WeChatForwardFile": WeChatForwardFile,
+    "WeChatAppMsg": WeChatAppMsg,
+    "WeChatForwardQuote": WeChatForwardQuote,
+    "WeChatFile": WeChatFile,
+}
+"""Component classes keyed by the `type` tag used on the wire."""
+
+_TAG_BY_COMPONENT_CLASS: dict[type[MessageComponent], str] = {
+    component_class: tag for tag, component_class in _COMPONENT_TYPES.items()
+}
+
+
+def _component_tag(value: typing.Any) -> str:
+    """Pick the union member used to validate one message chain item.
+
+    Component instances are dispatched by class, so subclasses that are not
+    registered (and WeChatFile, whose `type` is "File") pass through as-is.
+    Raw dicts are dispatched by their `type` tag.
+    """
+    if isinstance(value, MessageComponent):
+        return _TAG_BY_COMPONENT_CLASS.get(type(value), "__component__")
+    if isinstance(value, dict):
+        if "type" not in value:
+            return "__invalid__"
+        component_type = value["type"]
+        if isinstance(component_type, str) and component_type in _COMPONENT_TYPES:
+            return component_type
+        return "__unknown__"
+    return "__invalid__"
+
+
+def _unknown_component(value: typing.Any) -> Unknown:
+    return Unknown(text=f"Unknown component type: {value['type']}")
+
+
+def _invalid_component(value: typing.Any) -> Unknown:
+    return Unknown(text=f"Invalid component data: {value}")
+
+
+_ChainComponent = typing.Annotated[
+    typing.Union[
+        tuple(
+            typing.Annotated[component_class, pydantic.Tag(tag)]
+            for tag, component_class in _COMPONENT_TYPES.items()
+        )
+        + (
+            typing.Annotated[
+                Unknown,
+                pydantic.BeforeValidator(_unknown_component),
+                pydantic.Tag("__unknown__"),
+            ],
+            typing.Annotated[
+                Unknown,
+                pydantic.BeforeValidator(_invalid_component),
+                pydantic.Tag("__invalid__"),
+            ],
+            typing.Annotated[
+                pydantic.SerializeAsAny[MessageComponent],
+                pydantic.Tag("__component__"),
+            ],
+        )
+    ],
+    pydantic.Discriminator(_component_tag),
+]
+"""A message chain item, validated by pydantic-core according to `_component_tag`."""
+
+MessageChain.model_rebuild()
+Quote.model_rebuild()
+ForwardMessageNode.model_rebuild()
+Forward.model_rebuild()
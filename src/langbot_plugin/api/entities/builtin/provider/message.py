@@ -140,7 +140,7 @@ class Message(pydantic.BaseModel):
         if self.content is None:
             return None
         elif isinstance(self.content, str):
-            return platform_message.MessageChain(
+            return platform_message.MessageChain.from_trusted(
                 [platform_message.Plain(text=(prefix_text + self.content))]
             )
         elif isinstance(self.content, list):
@@ -179,7 +179,7 @@ class Message(pydantic.BaseModel):
                 else:
                     mc.insert(0, platform_message.Plain(text=prefix_text))
 
-            return platform_message.MessageChain(mc)
+            return platform_message.MessageChain.from_trusted(mc)
 
 
 class MessageChunk(pydantic.BaseModel):
@@ -236,7 +236,7 @@ class MessageChunk(pydantic.BaseModel):
         if self.content is None:
             return None
         elif isinstance(self.content, str):
-            return platform_message.MessageChain(
+            return platform_message.MessageChain.from_trusted(
                 [platform_message.Plain(text=(prefix_text + self.content))]
             )
         elif isinstance(self.content, list):
@@ -274,7 +274,7 @@ class MessageChunk(pydantic.BaseModel):
                 else:
                     mc.insert(0, platform_message.Plain(text=prefix_text))
 
-            return platform_message.MessageChain(mc)
+            return platform_message.MessageChain.from_trusted(mc)
 
 
 class ToolCallChunk(pydantic.BaseModel):
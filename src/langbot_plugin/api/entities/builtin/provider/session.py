@@ -48,9 +48,6 @@ class Conversation(pydantic.BaseModel):
     Instead, when using Dify API or other services that manage conversation information externally,
     it is used to bind the external session. The specific usage depends on the Runner."""
 
-    class Config:
-        arbitrary_types_allowed = True
-
     @pydantic.field_serializer("create_time")
     def serialize_create_time(self, v, _info):
         return v.timestamp()
@@ -99,9 +96,6 @@ class Session(WorkspaceExecutionScope):
     _semaphore: typing.Optional[asyncio.Semaphore] = pydantic.PrivateAttr(default=None)
     """The semaphore of the current session, used to limit concurrency"""
 
-    class Config:
-        arbitrary_types_allowed = True
-
     @pydantic.field_serializer("launcher_type")
     def serialize_launcher_type(self, v, _info):
         return v.value
@@ -1,46 +1,83 @@
-"""RAG-related entities and protocols."""
+"""RAG-related entities and protocols.
+
+Names are re-exported lazily: importing one submodule (e.g. `rag.models`
+for a Parser) does not import the others and build their models.
+"""
 
 from __future__ import annotations
 
-# Enumerations
-from .enums import (
-    DocumentStatus,
-    SearchType,
-)
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    # Enumerations
+    from .enums import (
+        DocumentStatus,
+        SearchType,
+    )
 
-# Data models
-from .models import (
-    FileMetadata,
-    FileObject,
-    TextChunk,
-    TextSection,
-    ParseContext,
-    ParseResult,
-    IngestionContext,
-    IngestionResult,
-)
+    # Data models
+    from .models import (
+        FileMetadata,
+        FileObject,
+        TextChunk,
+        TextSection,
+        ParseContext,
+        ParseResult,
+        IngestionContext,
+        IngestionResult,
+    )
 
-# Error types
-from .errors import (
-    RAGError,
-    HostServiceError,
-    EmbeddingError,
-    VectorStoreError,
-    CollectionNotFoundError,
-    FileServiceError,
-    IngestionError,
-    RetrievalError,
-    ParsingError,
-    ChunkingError,
-)
+    # Error types
+    from .errors import (
+        RAGError,
+        HostServiceError,
+        EmbeddingError,
+        VectorStoreError,
+        CollectionNotFoundError,
+        FileServiceError,
+        IngestionError,
+        RetrievalError,
+        ParsingError,
+        ChunkingError,
+    )
 
+    # Context and retrieval types
+    from .context import (
+        RetrievalResultEntry,
+        RetrievalContext,
+        RetrievalResponse,
+    )
 
-# Context and retrieval types
-from .context import (
-    RetrievalResultEntry,
-    RetrievalContext,
-    RetrievalResponse,
-)
+_LAZY_EXPORTS: dict[str, str] = {
+    # Enums
+    "DocumentStatus": ".enums",
+    "SearchType": ".enums",
+    # Models
+    "FileMetadata": ".models",
+    "FileObject": ".models",
+    "TextChunk": ".models",
+    "TextSection": ".models",
+    "ParseContext": ".models",
+    "ParseResult": ".models",
+    "IngestionContext": ".models",
+    "IngestionResult": ".models",
+    # Errors
+    "RAGError": ".errors",
+    "HostServiceError": ".errors",
+    "EmbeddingError": ".errors",
+    "VectorStoreError": ".errors",
+    "CollectionNotFoundError": ".errors",
+    "FileServiceError": ".errors",
+    "IngestionError": ".errors",
+    "RetrievalError": ".errors",
+    "ParsingError": ".errors",
+    "ChunkingError": ".errors",
+    # Context
+    "RetrievalResultEntry": ".context",
+    "RetrievalContext": ".context",
+    "RetrievalResponse": ".context",
+}
 
 __all__ = [
     # Enums
@@ -71,3 +108,16 @@ __all__ = [
     "RetrievalContext",
     "RetrievalResponse",
 ]
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
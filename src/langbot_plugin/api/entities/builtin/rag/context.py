@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pydantic
 from typing import Any
-from pydantic import Field
+from pydantic import Field, SkipValidation
 
 from langbot_plugin.api.entities.builtin.provider.message import ContentElement
 
@@ -16,7 +16,7 @@ class RetrievalResultEntry(pydantic.BaseModel):
     content: list[ContentElement]
     """Content elements of the result."""
 
-    metadata: dict[str, Any]
+    metadata: SkipValidation[dict[str, Any]]
     """Metadata associated with this result."""
 
     distance: float
@@ -65,5 +65,5 @@ class RetrievalResponse(pydantic.BaseModel):
     total_found: int
     """Total number of results found before top_k filtering."""
 
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: SkipValidation[dict[str, Any]] = Field(default_factory=dict)
     """Additional response metadata (e.g., query rewriting info, timing)."""
@@ -23,9 +23,6 @@ class BaseEventModel(WorkspaceExecutionScope):
     )
     """Only stored in LangBot process"""
 
-    class Config:
-        arbitrary_types_allowed = True
-
     @pydantic.model_validator(mode="after")
     def inherit_query_execution_scope(self) -> BaseEventModel:
         """Copy the trusted Query scope into the serialized event payload."""
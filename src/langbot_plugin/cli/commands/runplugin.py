@@ -7,6 +7,7 @@ import os
 from langbot_plugin.utils.discover.engine import ComponentDiscoveryEngine
 from langbot_plugin.utils.log import configure_process_logging
 from langbot_plugin.cli.run.controller import PluginRuntimeController
+from langbot_plugin.api.entities.builtin.platform.message import close_http_clients
 from langbot_plugin.cli.i18n import cli_print
 from langbot_plugin.cli.utils.page_components import (
     discover_plugin_components,
@@ -84,9 +85,12 @@ async def arun_plugin_process(
     )
 
     controller_run_task = asyncio.create_task(controller.run())
-    await controller.mount()
+    try:
+        await controller.mount()
 
-    await controller_run_task
+        await controller_run_task
+    finally:
+        await close_http_clients()
 
 
 def run_plugin_process(
@@ -12,6 +12,9 @@ from langbot_plugin.entities.io.context import (
 
 
 class ActionRequest(pydantic.BaseModel):
+    # Send NaN/Infinity as json.dumps does instead of pydantic's default null
+    model_config = pydantic.ConfigDict(ser_json_inf_nan="constants")
+
     seq_id: int = pydantic.Field(..., description="The sequence id of the request")
     action: str
     data: dict[str, Any]
@@ -42,3 +45,7 @@ class ActionRequest(pydantic.BaseModel):
         # present, while serializing the context envelope for new peers.
         kwargs.setdefault("exclude_none", True)
         return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs):
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump_json(**kwargs)
@@ -16,6 +16,9 @@ class ChunkStatus(enum.Enum):
 
 
 class ActionResponse(pydantic.BaseModel):
+    # Send NaN/Infinity as json.dumps does instead of pydantic's default null
+    model_config = pydantic.ConfigDict(ser_json_inf_nan="constants")
+
     seq_id: Optional[int] = None
     code: int = pydantic.Field(..., description="The code of the response")
     message: str = pydantic.Field(..., description="The message of the response")
@@ -229,8 +229,10 @@ class Handler(abc.ABC):
             self._message_blocking_scope(action_context),
         ):
             return await asyncio.to_thread(
-                lambda: json.dumps(
-                    payload.model_dump() if hasattr(payload, "model_dump") else payload
+                lambda: (
+                    payload.model_dump_json()
+                    if hasattr(payload, "model_dump_json")
+                    else json.dumps(payload)
                 )
             )
 
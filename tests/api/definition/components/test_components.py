@@ -3,8 +3,14 @@ from __future__ import annotations
 import pytest
 
 from langbot_plugin.api.definition.components.base import BaseComponent, NoneComponent
-from langbot_plugin.api.definition.components.command.command import Command
+from langbot_plugin.api.definition.components.command.command import (
+    Command,
+    Subcommand,
+)
 from langbot_plugin.api.definition.components.common.event_listener import EventListener
+from langbot_plugin.api.definition.components.knowledge_engine.cache import (
+    EmbeddingCache,
+)
 from langbot_plugin.api.definition.components.knowledge_engine.engine import (
     KnowledgeEngine,
     KnowledgeEngineCapability,
@@ -17,6 +23,12 @@ from langbot_plugin.api.definition.components.page import (
 from langbot_plugin.api.definition.components.parser.parser import Parser
 from langbot_plugin.api.definition.components.tool.tool import Tool
 from langbot_plugin.api.entities.builtin.command.context import CommandReturn
+from langbot_plugin.api.entities.builtin.rag.context import (
+    RetrievalContext,
+    RetrievalResponse,
+    RetrievalResultEntry,
+)
+from langbot_plugin.api.entities.builtin.rag.errors import EmbeddingError
 from langbot_plugin.api.entities.events import PersonMessageReceived
 
 
@@ -54,7 +66,7 @@ def test_command_subcommand_decorator_records_metadata():
     registered = command.registered_subcommands["run"]
     assert registered.help == "Run"
     assert registered.usage == "/run"
-    assert registered.aliases == ["r"]
+    assert registered.aliases == ("r",)
 
 
 def test_command_subcommand_default_aliases_should_not_be_shared():
@@ -69,9 +81,23 @@ def test_command_subcommand_default_aliases_should_not_be_shared():
 
     first.subcommand("first")(first_handler)
     second.subcommand("second")(second_handler)
-    first.registered_subcommands["first"].aliases.append("alias")
 
-    assert second.registered_subcommands["second"].aliases == []
+    assert first.registered_subcommands["first"].aliases == ()
+    assert second.registered_subcommands["second"].aliases == ()
+    with pytest.raises(AttributeError):
+        first.registered_subcommands["first"].aliases.append("alias")
+
+
+def test_subcommand_defaults_share_empty_values():
+    async def handler(_ctx):
+        yield CommandReturn(text="ok")
+
+    first = Subcommand(subcommand=handler)
+    second = Subcommand(subcommand=handler)
+
+    assert first.help == first.usage == ""
+    assert first.aliases == ()
+    assert first.aliases is second.aliases
 
 
 def test_page_request_response_helpers_and_default_handler():
@@ -93,6 +119,198 @@ def test_knowledge_engine_default_capabilities():
     assert KnowledgeEngine.get_capabilities() == [
         KnowledgeEngineCapability.DOC_INGESTION
     ]
+    assert KnowledgeEngineCapability.DOC_INGESTION in KnowledgeEngine.CAPABILITIES
+
+
+def test_knowledge_engine_capabilities_attribute_is_reported_sorted():
+    class ParsingEngine(KnowledgeEngine):
+        CAPABILITIES = frozenset(
+            {
+                KnowledgeEngineCapability.DOC_PARSING,
+                KnowledgeEngineCapability.DOC_INGESTION,
+            }
+        )
+
+    assert ParsingEngine.get_capabilities() == ["doc_ingestion", "doc_parsing"]
+
+
+class _RecordingEngine(KnowledgeEngine):
+    async def ingest(self, context):
+        raise NotImplementedError
+
+    async def delete_document(self, kb_id, document_id):
+        raise NotImplementedError
+
+    async def retrieve(self, context):
+        raise NotImplementedError
+
+
+class _EmbeddingPlugin:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def invoke_embedding(self, embedding_model_uuid, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_knowledge_engine_embed_in_batches_preserves_input_order():
+    engine = _RecordingEngine()
+    engine.plugin = _EmbeddingPlugin()
+    texts = ["a", "bbbb", "cc", "ddddd", "eee"]
+
+    vectors = await engine.embed_in_batches("model", texts, batch_size=2)
+
+    assert vectors == [[1.0], [4.0], [2.0], [5.0], [3.0]]
+    assert engine.plugin.calls == [["ddddd", "bbbb"], ["eee", "cc"], ["a"]]
+    assert await engine.embed_in_batches("model", []) == []
+    with pytest.raises(ValueError):
+        await engine.embed_in_batches("model", texts, batch_size=0)
+
+
+@pytest.mark.asyncio
+async def test_knowledge_engine_embed_in_batches_skips_duplicates_and_cached_texts():
+    engine = _RecordingEngine()
+    engine.plugin = _EmbeddingPlugin()
+    cache = EmbeddingCache(ttl=None)
+
+    vectors = await engine.embed_in_batches("model", ["a", "bb", "a"], cache=cache)
+    assert vectors == [[1.0], [2.0], [1.0]]
+    assert engine.plugin.calls == [["bb", "a"]]
+
+    vectors = await engine.embed_in_batches("model", ["bb", "ccc"], cache=cache)
+    assert vectors == [[2.0], [3.0]]
+    assert engine.plugin.calls[-1] == ["ccc"]
+
+    await engine.embed_in_batches("other-model", ["bb"], cache=cache)
+    assert engine.plugin.calls[-1] == ["bb"]
+
+
+@pytest.mark.asyncio
+async def test_knowledge_engine_embed_in_batches_rejects_short_responses():
+    class ShortPlugin(_EmbeddingPlugin):
+        async def invoke_embedding(self, embedding_model_uuid, texts):
+            return (await super().invoke_embedding(embedding_model_uuid, texts))[:-1]
+
+    engine = _RecordingEngine()
+    engine.plugin = ShortPlugin()
+    cache = EmbeddingCache(ttl=None)
+
+    with pytest.raises(EmbeddingError, match="returned 1 vectors for 2 texts"):
+        await engine.embed_in_batches("model", ["a", "bb"], cache=cache)
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_knowledge_engine_retrieve_hybrid_fuses_rankings():
+    def entry(entry_id: str) -> RetrievalResultEntry:
+        return RetrievalResultEntry(id=entry_id, content=[], metadata={}, distance=0.0)
+
+    async def vector_fn(_ctx):
+        return [entry("a"), entry("b")]
+
+    async def keyword_fn(_ctx):
+        return [entry("b"), entry("c")]
+
+    response = await _RecordingEngine().retrieve_hybrid(
+        RetrievalContext(query="q"), vector_fn, keyword_fn
+    )
+
+    assert [result.id for result in response.results] == ["b", "a", "c"]
+    assert response.total_found == 3
+    assert response.results[0].score == pytest.approx(1 / 62 + 1 / 61)
+
+
+def test_embedding_cache_expires_and_evicts_least_recently_used():
+    cache = EmbeddingCache(max_entries=2, ttl=60.0)
+    cache.put("a", "scope", [1.0, 0.0])
+    cache.put("b", "scope", [0.0, 1.0])
+    assert cache.get("a") is not None
+    cache.put("c", "scope", [1.0, 1.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a").vector == [1.0, 0.0]
+
+    expired = EmbeddingCache(ttl=0.0)
+    expired.put("a", "scope", [1.0])
+    assert expired.get("a") is None
+    assert len(expired) == 0
+
+    persistent = EmbeddingCache(ttl=None)
+    persistent.put("a", "scope", [1.0])
+    assert persistent.get("a").expires_at == float("inf")
+
+    assert EmbeddingCache.make_key("s", "m|x", "q") != EmbeddingCache.make_key(
+        "s", "m", "x|q"
+    )
+
+
+def test_embedding_cache_near_lookup_scans_recent_candidates_only():
+    dimension = 1536
+    cache = EmbeddingCache(max_near_candidates=64)
+    response = RetrievalResponse(results=[], total_found=0)
+
+    def vector(hot: int) -> list[float]:
+        values = [0.0] * dimension
+        values[hot] = 1.0
+        return values
+
+    for index in range(1024):
+        cache.put(str(index), "scope", vector(index % dimension), response)
+
+    assert cache.get_near("scope", vector(1023), 0.99) is cache.get("1023")
+    assert cache.get_near("scope", vector(960), 0.99) is cache.get("960")
+    assert cache.get_near("scope", vector(959), 0.99) is None
+    assert cache.get_near("other", vector(1023), 0.99) is None
+
+
+@pytest.mark.asyncio
+async def test_knowledge_engine_retrieve_cached_reuses_similar_queries():
+    class Engine(_RecordingEngine):
+        def __init__(self):
+            super().__init__()
+            self.retrievals = 0
+
+        async def retrieve(self, context):
+            self.retrievals += 1
+            return RetrievalResponse(results=[], total_found=self.retrievals)
+
+    class Plugin:
+        def __init__(self):
+            self.calls = 0
+
+        async def invoke_embedding(self, embedding_model_uuid, texts):
+            self.calls += 1
+            return [
+                {"hello": [1.0, 0.0], "hello!": [0.99, 0.05]}.get(texts[0], [0.0, 1.0])
+            ]
+
+    engine = Engine()
+    engine.plugin = Plugin()
+    cache = EmbeddingCache()
+    kb = {"knowledge_base_id": "kb"}
+
+    first = await engine.retrieve_cached(
+        RetrievalContext(query="hello", **kb), "model", cache
+    )
+    again = await engine.retrieve_cached(
+        RetrievalContext(query="hello", **kb), "model", cache
+    )
+    similar = await engine.retrieve_cached(
+        RetrievalContext(query="hello!", **kb), "model", cache
+    )
+    other = await engine.retrieve_cached(
+        RetrievalContext(query="bye", **kb), "model", cache
+    )
+    other_kb = await engine.retrieve_cached(
+        RetrievalContext(query="hello", knowledge_base_id="kb2"), "model", cache
+    )
+
+    assert first is again is similar
+    assert other.total_found == 2
+    assert other_kb.total_found == 3
+    assert engine.plugin.calls == 4
 
 
 def test_abstract_component_kinds_are_stable():
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+
+import pytest
+from pydantic import ValidationError
+
 from langbot_plugin.api.entities.builtin.provider.message import ContentElement
 from langbot_plugin.api.entities.builtin.rag.context import (
     RetrievalContext,
@@ -114,6 +120,32 @@ def test_retrieval_context_collection_id_fallbacks_and_response_model():
     assert response.metadata == {}
 
 
+def test_rag_metadata_is_passed_through_without_copying():
+    metadata = {"doc": "a", "page": 1}
+    entry = RetrievalResultEntry(
+        id="chunk",
+        content=[ContentElement.from_text("hello")],
+        metadata=metadata,
+        distance=0.1,
+    )
+
+    assert entry.metadata is metadata
+    assert entry.model_dump(mode="json")["metadata"] == {"doc": "a", "page": 1}
+
+
+def test_rag_ingestion_metadata_is_copied_and_validated():
+    base = {"doc": "a"}
+    chunks = [
+        TextChunk(text=text, chunk_id=text, document_id="doc", metadata=base)
+        for text in ("x", "y")
+    ]
+    chunks[0].metadata["chunk_index"] = 0
+
+    assert chunks[1].metadata == base == {"doc": "a"}
+    with pytest.raises(ValidationError):
+        TextChunk(text="x", chunk_id="x", document_id="doc", metadata=None)
+
+
 def test_rag_host_service_errors_preserve_original_error():
     original = RuntimeError("backend unavailable")
 
@@ -134,3 +166,20 @@ def test_rag_specialized_errors_keep_context_fields():
     assert collection_error.collection_id == "kb-1"
     assert str(collection_error) == "Collection not found or not accessible: kb-1"
     assert parsing_error.file_path == "docs/a.txt"
+
+
+def test_rag_package_reexports_lazily():
+    code = (
+        "import sys\n"
+        "import langbot_plugin.api.entities.builtin.rag.models\n"
+        "assert 'langbot_plugin.api.entities.builtin.rag.context' not in sys.modules\n"
+        "from langbot_plugin.api.entities.builtin.rag import RetrievalContext\n"
+        "assert RetrievalContext.__module__.endswith('rag.context')\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    import langbot_plugin.api.entities.builtin.rag as rag
+
+    assert all(getattr(rag, name) is not None for name in rag.__all__)
+    with pytest.raises(AttributeError):
+        rag.NotARagName
@@ -1,4 +1,5 @@
 import pytest
+from pydantic import ValidationError
 from langbot_plugin.api.entities.events import (
     BaseEventModel,
     PersonMessageReceived,
@@ -316,3 +317,89 @@ def test_validation_errors():
             sender_id="789012",
             message_chain=MessageChain([Plain(text="Hello")]).model_dump(),
         )
+
+
+def test_message_event_dump_omits_platform_object_and_unset_scope():
+    event = _make_group_message()
+    event.source_platform_object = object()
+    event.workspace_uuid = "workspace"
+
+    serialized = event.model_dump()
+
+    assert "source_platform_object" not in serialized
+    assert "instance_uuid" not in serialized
+    assert serialized["workspace_uuid"] == "workspace"
+    assert serialized["type"] == "GroupMessage"
+    assert serialized["sender"]["group"]["id"] == "123456"
+    assert serialized["message_chain"] == [{"type": "Plain", "text": "hi"}]
+    assert event.model_dump(exclude={"message_chain": {0: {"text"}}})[
+        "message_chain"
+    ] == [{"type": "Plain"}]
+
+
+def test_platform_event_repr_skips_type_and_empty_fields():
+    event = _make_friend_message()
+
+    assert FriendMessage._repr_fields[-1] == "sender"
+    assert "type" not in FriendMessage._repr_fields
+    assert repr(event).startswith("FriendMessage(message_chain=MessageChain(")
+    assert "time=" not in repr(event)
+
+
+def test_platform_event_parse_subtype_dispatches_on_type_tag():
+    from langbot_plugin.api.entities.builtin.platform.events import (
+        Event,
+        FeedbackEvent,
+    )
+
+    feedback = Event.parse_subtype(
+        {"type": "FeedbackEvent", "feedback_id": "f1", "feedback_type": 1}
+    )
+    assert isinstance(feedback, FeedbackEvent)
+    assert Event.get_subtype("GroupMessage") is GroupMessage
+    assert Event.get_subtype("Missing") is Event
+
+    unknown = Event.parse_subtype({"type": "Missing"})
+    assert type(unknown) is Event
+    assert unknown.type == "Missing"
+
+    with pytest.raises(ValidationError):
+        Event.parse_subtype({"type": "FriendMessage"})
+
+    class PluginFriendMessage(FriendMessage):
+        pass
+
+    assert Event.get_subtype("FriendMessage") is FriendMessage
+
+    with pytest.raises(Exception):
+        FriendMessage(
+            type="GroupMessage",
+            sender=Friend(id="1", nickname="Test", remark=""),
+            message_chain=MessageChain([]),
+        )
+
+
+def test_message_event_validation_keeps_built_models():
+    chain = MessageChain([Plain(text="hi")])
+    sender = Friend(id="789012", nickname="Test", remark="")
+
+    event = FriendMessage.model_validate({"sender": sender, "message_chain": chain})
+    assert event.message_chain is chain
+    assert event.sender is sender
+
+
+def test_group_message_group_follows_sender():
+    event = _make_group_message()
+    other = GroupMember(
+        id="1",
+        member_name="Other",
+        permission=Permission.Member,
+        group=Group(id="654321", name="Other", permission=Permission.Member),
+    )
+
+    assert event.group is event.sender.group
+    assert "group" not in event.model_dump()
+    assert event.model_copy(update={"sender": other}).group.id == "654321"
+
+    event.sender = other
+    assert event.group.id == "654321"
@@ -189,6 +189,28 @@ async def test_arun_plugin_process_uses_debug_runtime_ws_url(tmp_path, monkeypat
     assert FakeRuntimeController.instances[-1].ws_debug_url == "ws://debug"
 
 
+async def test_arun_plugin_process_closes_http_clients_on_exit(tmp_path, monkeypatch):
+    closed = []
+
+    async def fake_close_http_clients():
+        closed.append(True)
+
+    (tmp_path / "manifest.yaml").write_text("kind: Plugin\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(runplugin, "ComponentDiscoveryEngine", FakeDiscoveryEngine)
+    monkeypatch.setattr(
+        runplugin, "discover_plugin_components", lambda plugin_manifest, engine: []
+    )
+    monkeypatch.setattr(runplugin, "populate_plugin_pages", lambda *args: None)
+    monkeypatch.setattr(runplugin, "PluginRuntimeController", FakeRuntimeController)
+    monkeypatch.setattr(runplugin, "close_http_clients", fake_close_http_clients)
+
+    await runplugin.arun_plugin_process(stdio=True)
+
+    assert sorted(FakeRuntimeController.instances[-1].calls) == ["mount", "run"]
+    assert closed == [True]
+
+
 def test_run_plugin_process_configures_logging_and_runs_async_entry(monkeypatch):
     calls = []
     monkeypatch.setattr(
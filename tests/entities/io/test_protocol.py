@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
@@ -47,6 +49,7 @@ def test_action_request_factory_preserves_protocol_fields():
         "action": "get_bot_uuid",
         "data": {"query_id": 1001},
     }
+    assert json.loads(request.model_dump_json()) == request.model_dump()
 
 
 def test_action_request_requires_mapping_data():
@@ -71,6 +74,7 @@ def test_action_request_serializes_optional_workspace_context_envelope():
         "context": context.model_dump(),
     }
     assert ActionRequest.model_validate(request.model_dump()).context == context
+    assert json.loads(request.model_dump_json()) == request.model_dump()
 
 
 def test_action_request_preserves_complete_installation_binding():
@@ -300,6 +304,19 @@ def test_action_response_success_error_and_chunk_serialization():
     assert ActionResponse.model_validate(dumped).chunk_status is ChunkStatus.END
 
 
+def test_action_messages_encode_nan_and_infinity_like_json_dumps():
+    data = {"distance": float("nan"), "scores": [float("inf"), float("-inf")]}
+    encoded = [
+        ActionRequest.make_request(1, "ping", data).model_dump_json(),
+        ActionResponse.success(data).model_dump_json(),
+    ]
+
+    for payload in encoded:
+        assert "NaN" in payload and "-Infinity" in payload
+        decoded = json.loads(payload)["data"]
+        assert decoded["scores"] == [float("inf"), float("-inf")]
+
+
 def test_action_response_normalizes_missing_chunk_status_to_continue():
     response = ActionResponse(
         seq_id=1, code=0, message="ok", data={}, chunk_status=None
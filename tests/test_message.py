@@ -1,4 +1,5 @@
 import httpx
+import json
 import pytest  # type: ignore
 from datetime import datetime
 from langbot_plugin.api.entities.builtin.platform.message import (
@@ -12,6 +13,8 @@ from langbot_plugin.api.entities.builtin.platform.message import (
     Forward,
     ForwardMessageNode,
     ForwardMessageDiaplay,
+    _get_http_client,
+    close_http_clients,
     _read_httpx_body_limited,
 )
 
@@ -166,6 +169,55 @@ def test_message_chain_serialization():
     assert deserialized_chain[5].origin[0].text == "Original message"
 
 
+def test_message_chain_json_matches_model_dump():
+    """测试 JSON 序列化与 model_dump 输出一致，包括嵌套消息链中的 Source"""
+    source_time = datetime(2024, 1, 1, 12, 0, 0)
+    chain = MessageChain(
+        [
+            Source(id=1, time=source_time),
+            Quote(
+                id=1,
+                origin=MessageChain([Source(id=2, time=source_time), Plain(text="q")]),
+            ),
+        ]
+    )
+
+    dumped = chain.model_dump()
+    assert dumped[1]["origin"][0] == {
+        "type": "Source",
+        "id": 2,
+        "timestamp": int(source_time.timestamp()),
+    }
+    assert json.loads(chain.model_dump_json()) == dumped
+
+
+def test_message_chain_iadd_extends_in_place():
+    chain = MessageChain([Plain(text="a")])
+    root = chain.root
+    shared = chain
+
+    chain += MessageChain([Plain(text="b")])
+    chain += At(target=1)
+    chain += "c"
+
+    assert chain.root is root
+    assert shared is chain
+    assert str(shared) == "ab@1c"
+    with pytest.raises(TypeError):
+        chain += 1
+
+
+def test_message_chain_add_accepts_the_same_operands_as_iadd():
+    chain = MessageChain([Plain(text="a")])
+
+    assert str(chain + At(target=1) + "b") == "a@1b"
+    assert str("x" + chain) == "xa"
+    assert str(At(target=2) + chain) == "@2a"
+    assert str(chain) == "a"
+    with pytest.raises(TypeError):
+        chain + 1
+
+
 def test_message_chain_contains():
     """测试消息链的包含操作"""
     chain = MessageChain([Plain(text="Hello"), At(target=123456), AtAll()])
@@ -189,6 +241,14 @@ def test_message_chain_with_source():
     assert chain.source is not None
     assert chain.source.id == 12345
     assert chain.message_id == 12345
+    assert str(chain) == "Hello"
+
+
+def test_message_chain_str_skips_source_at_any_position():
+    """测试 Source 不在首位时也不出现在文本中"""
+    received = MessageChain([Source(id=1, time=datetime.now()), Plain(text="hello")])
+
+    assert str(MessageChain([At(target=1)]) + received) == "@1hello"
 
 
 def test_message_chain_with_quote():
@@ -323,6 +383,21 @@ def test_message_chain_with_image():
     assert chain[0].image_id == "test_image_id"
 
 
+def test_image_equality_compares_uuid():
+    group_image = Image(image_id="{01234567-89AB-CDEF-0123-456789ABCDEF}.jpg")
+    friend_image = Image(image_id="/01234567-89AB-CDEF-0123-456789ABCDEF")
+
+    assert group_image.uuid == "01234567-89AB-CDEF-0123-456789ABCDEF"
+    assert group_image == friend_image
+    assert group_image != Image(image_id="other")
+    assert Image(url="http://example.com/a.png").uuid == ""
+
+    group_image.image_id = "/other"
+    assert group_image.uuid == "other"
+    assert "uuid" not in group_image.model_dump()
+    assert group_image.model_copy(update={"image_id": "/xyz"}).uuid == "xyz"
+
+
 @pytest.mark.asyncio
 async def test_image_remote_body_is_bounded():
     response = httpx.Response(200, content=b"oversized")
@@ -331,6 +406,80 @@ async def test_image_remote_body_is_bounded():
         await _read_httpx_body_limited(response, max_bytes=4)
 
 
+@pytest.mark.asyncio
+async def test_image_get_bytes_from_base64():
+    image = Image(base64="data:image/png;base64,aGVsbG8=")
+    assert await image.get_bytes() == (b"hello", "image/png")
+
+    with pytest.raises(ValueError, match="Invalid base64"):
+        await Image(base64="aGVsbG8=").get_bytes()
+    with pytest.raises(ValueError, match="Invalid base64"):
+        await Image(base64="aGVsbG8=;base64,aGVsbG8=").get_bytes()
+
+
+@pytest.mark.asyncio
+async def test_message_chain_fetch_images_keeps_chain_order():
+    chain = MessageChain(
+        [
+            Image(base64="data:image/png;base64,Zmlyc3Q="),
+            Plain(text="between"),
+            Image(base64="data:image/gif;base64,c2Vjb25k"),
+        ]
+    )
+
+    assert await chain.fetch_images(concurrency=1) == [
+        (b"first", "image/png"),
+        (b"second", "image/gif"),
+    ]
+    with pytest.raises(ValueError):
+        await chain.fetch_images(concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_image_http_client_is_reused_per_loop():
+    client = _get_http_client()
+    assert _get_http_client() is client
+
+    await client.aclose()
+    replacement = _get_http_client()
+    assert replacement is not client
+    await replacement.aclose()
+
+
+async def test_close_http_clients_closes_the_loop_client():
+    client = _get_http_client()
+
+    await close_http_clients()
+
+    assert client.is_closed
+    assert _get_http_client() is not client
+    await close_http_clients()
+    await close_http_clients()
+
+
+def test_message_chain_from_trusted_keeps_components():
+    components = [Plain(text="Hello"), AtAll()]
+    chain = MessageChain.from_trusted(components)
+
+    assert chain.root is components
+    assert chain == MessageChain([Plain(text="Hello"), AtAll()])
+    assert chain.model_dump() == [
+        {"type": "Plain", "text": "Hello"},
+        {"type": "AtAll"},
+    ]
+
+
+def test_message_chain_init_keeps_components_in_a_copied_list():
+    components = [Plain(text="Hello"), AtAll()]
+    chain = MessageChain(components)
+
+    assert chain.root is not components
+    assert chain[0] is components[0]
+    assert chain.model_fields_set == {"root"}
+    assert MessageChain().root == []
+    assert MessageChain().root is not MessageChain().root
+
+
 def test_message_chain_validation():
     """测试消息链的验证"""
     # 测试空消息链
@@ -342,6 +491,28 @@ def test_message_chain_validation():
         MessageChain([123])  # 整数不是有效的消息组件
 
 
+def test_message_chain_validate_unknown_and_invalid_items():
+    """测试未知类型和无效数据被替换为 Unknown 组件，且不修改输入"""
+    payload = [
+        {"type": "Nope"},
+        "junk",
+        {"type": "Source", "id": 1, "timestamp": 1700000000},
+        {"type": "Quote", "id": 2, "origin": [{"type": "Plain", "text": "q"}]},
+        {"type": None},
+        {"text": "no type"},
+    ]
+    chain = MessageChain.model_validate(payload)
+
+    assert chain[0].text == "Unknown component type: Nope"
+    assert chain[1].text == "Invalid component data: junk"
+    assert chain[2].time == datetime.fromtimestamp(1700000000)
+    assert isinstance(chain[3].origin, MessageChain)
+    assert isinstance(chain[3].origin[0], Plain)
+    assert chain[4].text == "Unknown component type: None"
+    assert chain[5].text == "Invalid component data: {'text': 'no type'}"
+    assert payload[2] == {"type": "Source", "id": 1, "timestamp": 1700000000}
+
+
 def test_person_message_received_serialization():
     """测试 PersonMessageReceived 事件的自动序列化"""
     from langbot_plugin.api.entities.events import PersonMessageReceived
@@ -427,6 +598,19 @@ def test_source_time_serialization():
     assert int(deserialized_source.time.timestamp()) == int(current_time.timestamp())
 
 
+def test_source_dump_follows_updated_time():
+    """测试修改或复制替换 time 后序列化使用新的时间戳"""
+    source = Source.model_validate({"id": 1, "timestamp": 1700000000})
+    assert source.model_dump()["timestamp"] == 1700000000
+
+    new_time = datetime(2024, 1, 1, 12, 0, 0)
+    copied = source.model_copy(update={"time": new_time})
+    assert copied.model_dump()["timestamp"] == int(new_time.timestamp())
+
+    source.time = new_time
+    assert source.model_dump()["timestamp"] == int(new_time.timestamp())
+
+
 def test_person_message_received_with_source():
     """测试 PersonMessageReceived 事件中带有 Source 的 message_chain 的序列化和反序列化"""
     from langbot_plugin.api.entities.events import PersonMessageReceived